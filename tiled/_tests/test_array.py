@@ -3,6 +3,7 @@ import string
 import warnings
 from pathlib import Path
 
+import dask
 import dask.array
 import httpx
 import numpy
@@ -10,7 +11,10 @@ import pytest
 
 from ..adapters.array import ArrayAdapter
 from ..adapters.mapping import MapAdapter
-from ..client import Context, from_context
+from ..client import Context
+from ..client import array as array_client
+from ..client import from_context, record_history
+from ..server import router
 from ..server.app import build_app
 from .utils import fail_with_status_code
 
@@ -44,6 +48,14 @@ cube_cases = {
     "tiny_hypercube": numpy.random.random((10, 10, 10, 10, 10)),
 }
 cube_tree = MapAdapter({k: ArrayAdapter.from_array(v) for k, v in cube_cases.items()})
+chunked_array = numpy.arange(200).reshape((10, 20))
+big_endian_array = numpy.arange(12.0).reshape((3, 4)).astype(">f8")
+chunked_tree = MapAdapter(
+    {
+        "example": ArrayAdapter.from_array(chunked_array, chunks=((5, 5), (3, 7, 10))),
+        "big_endian": ArrayAdapter.from_array(big_endian_array, chunks=((1, 2), (4,))),
+    }
+)
 inf_tree = MapAdapter(
     {
         "example": ArrayAdapter.from_array(
@@ -71,6 +83,7 @@ def context():
     tree = MapAdapter(
         {
             "array": array_tree,
+            "chunked": chunked_tree,
             "cube": cube_tree,
             "inf": inf_tree,
             "scalar": scalar_tree,
@@ -162,3 +175,112 @@ def test_array_interface(context):
         # smoke test
         v.chunks
         v.dims
+
+
+def test_read_blocks(context):
+    client = from_context(context)["chunked"]["example"]
+    blocks = [(0, 1), (1, 2), (0, 0)]
+    with record_history() as history:
+        actual = client.read_blocks(blocks)
+    assert len(history.requests) == 1
+    assert numpy.array_equal(actual[0], chunked_array[:5, 3:10])
+    assert numpy.array_equal(actual[1], chunked_array[5:, 10:])
+    assert numpy.array_equal(actual[2], chunked_array[:5, :3])
+    dask_client = from_context(context, "dask")["chunked"]["example"]
+    dask_actual = dask_client.read_blocks(blocks)
+    assert numpy.array_equal(dask_actual[1].compute(), chunked_array[5:, 10:])
+
+
+@pytest.mark.parametrize(
+    "gap_limit, expected_reads, expected_block_reads",
+    [
+        # The region spanning the blocks is too large: read each block.
+        (0, 0, 2),
+        # The region is small enough: read it once and cut the blocks out.
+        (1_000_000, 1, 0),
+    ],
+)
+def test_read_blocks_coalesced(
+    context, monkeypatch, gap_limit, expected_reads, expected_block_reads
+):
+    "The server returns the same blocks whether or not it coalesces the reads."
+    monkeypatch.setattr(router, "BLOCKS_COALESCE_GAP_BYTESIZE_LIMIT", gap_limit)
+    adapter = chunked_tree["example"]
+    calls = []
+    for name in ["read", "read_block"]:
+        method = getattr(adapter, name)
+
+        def counted(*args, name=name, method=method, **kwargs):
+            calls.append(name)
+            return method(*args, **kwargs)
+
+        monkeypatch.setattr(adapter, name, counted)
+    client = from_context(context)["chunked"]["example"]
+    blocks = [(0, 2), (1, 0)]
+    actual = client.read_blocks(blocks)
+    assert numpy.array_equal(actual[0], chunked_array[:5, 10:])
+    assert numpy.array_equal(actual[1], chunked_array[5:, :3])
+    assert calls.count("read") == expected_reads
+    assert calls.count("read_block") == expected_block_reads
+
+
+def test_read_whole_chunked_array_in_batches(context):
+    client = from_context(context)["chunked"]["example"]
+    with record_history() as history:
+        actual = client.read()
+    assert numpy.array_equal(actual, chunked_array)
+    # All six blocks are small enough to come back in one batch.
+    assert len(history.requests) == 1
+    # A slice fetches only the blocks it needs.
+    assert numpy.array_equal(client[5:, 10:], chunked_array[5:, 10:])
+
+
+@pytest.mark.parametrize("scheduler", ["sync", "threads"])
+def test_read_whole_chunked_array_with_scheduler(context, monkeypatch, scheduler):
+    "The batches are assembled correctly whichever scheduler runs them."
+    # Make each block its own batch, so that there are several tasks.
+    monkeypatch.setattr(array_client, "BLOCKS_BATCH_BYTESIZE_LIMIT", 1)
+    client = from_context(context)["chunked"]["example"]
+    with dask.config.set(scheduler=scheduler):
+        assert numpy.array_equal(client.read(), chunked_array)
+        assert numpy.array_equal(numpy.asarray(client), chunked_array)
+
+
+def test_read_big_endian_blocks(context):
+    "Blocks downloaded together keep their non-native byte order."
+    client = from_context(context)["chunked"]["big_endian"]
+    assert numpy.array_equal(client.read(), big_endian_array)
+    actual = client.read_blocks([(0, 0), (1, 0)])
+    assert numpy.array_equal(actual[0], big_endian_array[:1])
+    assert numpy.array_equal(actual[1], big_endian_array[1:])
+
+
+def test_lazy_read_fetches_only_used_blocks(context):
+    client = from_context(context, "dask")["chunked"]["example"]
+    lazy = client.read()
+    with record_history() as history:
+        actual = lazy[5:, 10:].compute()
+    assert numpy.array_equal(actual, chunked_array[5:, 10:])
+    (request,) = history.requests
+    assert "/array/block/" in request.url.path
+    # Computing the whole array in one go uses batches.
+    with record_history() as history:
+        assert numpy.array_equal(client.compute(), chunked_array)
+    assert len(history.requests) == 1
+
+
+def test_blocks_validation(context):
+    "Verify that each block must be well-formed, fully specified, and in range."
+    client = from_context(context)["chunked"]["example"]
+    blocks_url = httpx.URL(client.item["links"]["blocks"])
+    malformed_blocks_url = blocks_url.copy_with(params={"block": ["0,0", "0"]})
+    with fail_with_status_code(400):
+        client.context.http_client.get(malformed_blocks_url).raise_for_status()
+    unparsable_blocks_url = blocks_url.copy_with(params={"block": ["0,0", ",0"]})
+    with fail_with_status_code(400):
+        client.context.http_client.get(unparsable_blocks_url).raise_for_status()
+    out_of_range_url = blocks_url.copy_with(params={"block": ["0,0", "2,0"]})
+    with fail_with_status_code(400):
+        client.context.http_client.get(out_of_range_url).raise_for_status()
+    with pytest.raises(IndexError):
+        client.read_blocks([(0, 0), (0, 3)])
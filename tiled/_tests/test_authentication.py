@@ -2,17 +2,20 @@ import io
 import subprocess
 import sys
 import time
+import uuid
 
 import numpy
 import pytest
 
 from ..adapters.array import ArrayAdapter
 from ..adapters.mapping import MapAdapter
+from ..authn_database import orm
 from ..client import Context, from_context
 from ..client.auth import CannotRefreshAuthentication
 from ..client.context import clear_default_identity, get_default_identity
 from ..server import authentication
 from ..server.app import build_app_from_config
+from ..server.schemas import PrincipalType
 from .utils import fail_with_status_code
 
 arr = ArrayAdapter.from_array(numpy.ones((5, 5)))
@@ -449,3 +452,20 @@ def test_sticky_identity(enter_password, config):
     # Clear the default.
     clear_default_identity(context.api_uri)
     get_default_identity(context.api_uri) is None
+
+
+def test_orm_repr_skips_relationships():
+    "The repr of an ORM object shows its columns and never its relationships."
+    principal_uuid = uuid.uuid4()
+    principal = orm.Principal(uuid=principal_uuid, type=PrincipalType.user)
+    # Relationships that were never set are not initialized by repr.
+    assert repr(principal) == (
+        f"Principal(uuid={principal_uuid!r}, type={PrincipalType.user!r})"
+    )
+    assert not {"roles", "api_keys", "sessions", "identities"} & set(principal.__dict__)
+    # Relationships that were set are not shown.
+    principal.roles = [orm.Role(name="admin")]
+    api_key = orm.APIKey(first_eight="abcdefgh", principal=principal)
+    assert "roles" not in repr(principal)
+    assert "api_keys" not in repr(principal)
+    assert repr(api_key) == "APIKey(first_eight='abcdefgh')"
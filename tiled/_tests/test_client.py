@@ -1,3 +1,4 @@
+import ssl
 import sys
 import types
 from pathlib import Path
@@ -24,6 +25,28 @@ def test_configurable_timeout():
         assert context.http_client.timeout.read == 17
 
 
+def test_verify_reaches_transport(monkeypatch):
+    "The verify parameter is applied to the HTTPTransport that makes connections."
+    transports = []
+
+    class Unreachable(Exception):
+        pass
+
+    class RecordingTransport(httpx.HTTPTransport):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            transports.append(self)
+
+        def handle_request(self, request):
+            raise Unreachable
+
+    monkeypatch.setattr(httpx, "HTTPTransport", RecordingTransport)
+    with pytest.raises(Unreachable):
+        Context("https://example.invalid/api", verify=False)
+    (transport,) = transports
+    assert transport._pool._ssl_context.verify_mode == ssl.CERT_NONE
+
+
 def test_client_version_check():
     with Context.from_app(build_app(tree)) as context:
         client = from_context(context)
@@ -112,6 +112,15 @@ def test_export_weather_data_var(client, tmpdir):
     )
 
 
+def test_export_slice_with_numpy_integer(client):
+    "A numpy integer is accepted as a slice, as an int would be."
+    expected = io.BytesIO()
+    client["A"].export(expected, slice=3, format="text/csv")
+    buffer = io.BytesIO()
+    client["A"].export(buffer, slice=numpy.int64(3), format="text/csv")
+    assert buffer.getvalue() == expected.getvalue()
+
+
 def test_export_weather_all(client):
     buffer = io.BytesIO()
     client["structured_data"]["weather"].export(buffer, format="application/x-hdf5")
@@ -16,6 +16,7 @@ tiny_array = numpy.ones(5)
 tiny_df = pandas.DataFrame({"a": tiny_array})
 small_array = numpy.ones(50)
 small_df = pandas.DataFrame({"a": small_array})
+chunked_array = numpy.ones(50)
 size_limit = small_array.nbytes / 2
 assert tiny_array.nbytes < size_limit < small_array.nbytes
 assert tiny_df.memory_usage().sum() < size_limit < small_df.memory_usage().sum()
@@ -25,6 +26,7 @@ tree = MapAdapter(
     {
         "tiny_array": ArrayAdapter.from_array(tiny_array),
         "small_array": ArrayAdapter.from_array(small_array),
+        "chunked_array": ArrayAdapter.from_array(chunked_array, chunks=((5,) * 10,)),
         "tiny_df": DataFrameAdapter.from_pandas(tiny_df, npartitions=1),
         "small_df": DataFrameAdapter.from_pandas(small_df, npartitions=2),
     }
@@ -69,6 +71,16 @@ def test_array(client, tmpdir):
             client["small_array"].export(path)  # too big
 
 
+def test_chunked_array(client):
+    """
+    Download an array over the size limit made of blocks under the limit.
+    """
+    with low_size_limit():
+        # The blocks cannot be downloaded together in one batch, so the client
+        # falls back to downloading them one at a time.
+        assert numpy.array_equal(client["chunked_array"].read(), chunked_array)
+
+
 def test_dataframe(client, tmpdir):
     """
     Download an dataframe over the size limit.
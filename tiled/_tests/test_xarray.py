@@ -6,9 +6,12 @@ import xarray.testing
 
 from ..adapters.mapping import MapAdapter
 from ..adapters.xarray import DatasetAdapter
-from ..client import Context, from_context, record_history
+from ..catalog import in_memory
+from ..client import Context, container, from_context, record_history
 from ..client import xarray as xarray_client
+from ..client.xarray import write_xarray_dataset
 from ..server.app import build_app
+from ..structures.core import Spec
 
 image = numpy.random.random((3, 5))
 temp = 15 + 8 * numpy.random.randn(2, 2, 3)
@@ -49,6 +52,10 @@ EXPECTED = {
         {f"column_{i:03}": xarray.DataArray(i * numpy.ones(2)) for i in range(10)},
         coords={"time": numpy.arange(2)},
     ),
+    "indexed": xarray.Dataset(
+        {f"column_{i:03}": ("time", i * numpy.ones(3)) for i in range(10)},
+        coords={"time": numpy.arange(3)},
+    ),
     "ragged": xarray.Dataset(
         {
             f"{i}": xarray.DataArray(i * numpy.ones(2 * i), dims=f"dim{i}")
@@ -97,6 +104,17 @@ def test_wide_table_optimization(client):
     assert len(history.requests) < 4
 
 
+def test_wide_table_coords_fetched_with_data_vars(client):
+    "Coords that index the data_vars are downloaded in the same request."
+    indexed = client["indexed"]
+    with record_history() as history:
+        indexed.read()
+    data_requests = [
+        request for request in history.requests if "/node/full/" in request.url.path
+    ]
+    assert len(data_requests) == 1
+
+
 def test_wide_table_optimization_off(client):
     wide = client["wide"]
     with record_history() as history:
@@ -104,6 +122,17 @@ def test_wide_table_optimization_off(client):
     assert len(history.requests) >= 10
 
 
+def test_ragged_wide_table_optimization(client):
+    "Variables along the same dimension are batched even if the dataset is ragged."
+    ragged = client["ragged"]
+    with record_history() as history:
+        ragged.read()
+    block_requests = [
+        request for request in history.requests if "/array/block/" in request.url.path
+    ]
+    assert not block_requests
+
+
 def test_url_limit_handling(client):
     "Check that requests and split up to stay below the URL length limit."
     expected = EXPECTED["wide"]
@@ -144,3 +173,33 @@ def test_url_limit_handling(client):
     # number of requests may evolve as the library changes, but the trend should
     # hold.
     assert highest_request_count > higher_request_count > normal_request_count
+
+
+def test_variables_cache_invalidation(tmpdir, monkeypatch):
+    "A dataset client notices variables added or removed after its first read."
+    with Context.from_app(build_app(in_memory(writable_storage=tmpdir))) as context:
+        client = from_context(context)
+        write_xarray_dataset(
+            client, xarray.Dataset({"x": ("t", numpy.arange(3))}), key="ds"
+        )
+        ds_a = client["ds"]
+        # Writing through another client is noticed once the cache expires.
+        monkeypatch.setattr(xarray_client, "LENGTH_CACHE_TTL", 0)
+        monkeypatch.setattr(container, "LENGTH_CACHE_TTL", 0)
+        assert list(ds_a.read().data_vars) == ["x"]
+        ds_b = from_context(context)["ds"]
+        ds_b.write_array(
+            numpy.arange(3), key="y", specs=[Spec("xarray_data_var")], dims=["t"]
+        )
+        assert list(ds_a.read().data_vars) == ["x", "y"]
+        # Writing or deleting through this client invalidates its cache, even
+        # if the cache has not expired.
+        monkeypatch.setattr(xarray_client, "LENGTH_CACHE_TTL", 1_000)
+        monkeypatch.setattr(container, "LENGTH_CACHE_TTL", 1_000)
+        assert list(ds_a.read().data_vars) == ["x", "y"]
+        ds_a.delete("y")
+        assert list(ds_a.read().data_vars) == ["x"]
+        ds_a.write_array(
+            numpy.arange(3), key="z", specs=[Spec("xarray_data_var")], dims=["t"]
+        )
+        assert list(ds_a.read().data_vars) == ["x", "z"]
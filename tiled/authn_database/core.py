@@ -2,9 +2,9 @@ import hashlib
 import uuid as uuid_module
 from datetime import datetime
 
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 from sqlalchemy.sql import func
 
 from .base import Base
@@ -12,9 +12,12 @@ from .orm import APIKey, Identity, PendingSession, Principal, Role, Session
 
 # This is the alembic revision ID of the database revision
 # required by this version of Tiled.
-REQUIRED_REVISION = "c7bd2573716d"
+REQUIRED_REVISION = "e756b9381c14"
 # This is list of all valid revisions (from current to oldest).
 ALL_REVISIONS = [
+    "e756b9381c14",
+    "0b033e7fbe30",
+    "a66028395cab",
     "c7bd2573716d",
     "4a9dfaba4a98",
     "56809bcbfcb0",
@@ -123,8 +126,10 @@ async def lookup_valid_session(db, session_id):
         await db.execute(
             select(Session)
             .options(
-                selectinload(Session.principal).selectinload(Principal.roles),
-                selectinload(Session.principal).selectinload(Principal.identities),
+                # As in lookup_valid_api_key, join the Principal and its Roles
+                # into the same query and fetch Identities in one more query.
+                joinedload(Session.principal).joinedload(Principal.roles),
+                joinedload(Session.principal).selectinload(Principal.identities),
             )
             .filter(Session.uuid == uuid_module.UUID(hex=session_id))
         )
@@ -215,8 +220,11 @@ async def lookup_valid_api_key(db, secret):
         await db.execute(
             select(APIKey)
             .options(
-                selectinload(APIKey.principal).selectinload(Principal.roles),
-                selectinload(APIKey.principal).selectinload(Principal.identities),
+                # Fetch the Principal and its Roles in the same query as the
+                # key. Identities are a collection that would multiply the
+                # joined rows, so they are fetched in one more query.
+                joinedload(APIKey.principal).joinedload(Principal.roles),
+                joinedload(APIKey.principal).selectinload(Principal.identities),
             )
             .filter(APIKey.first_eight == secret.hex()[:8])
             .filter(APIKey.hashed_secret == hashed_secret)
@@ -0,0 +1,47 @@
+"""Use native UUID type on PostgreSQL.
+
+Revision ID: 0b033e7fbe30
+Revises: a66028395cab
+Create Date: 2023-08-16 15:02:44.918306
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+from tiled.authn_database.orm import Principal, Session
+
+# revision identifiers, used by Alembic.
+revision = "0b033e7fbe30"
+down_revision = "a66028395cab"
+branch_labels = None
+depends_on = None
+
+TABLES = [Principal.__tablename__, Session.__tablename__]
+
+
+def upgrade():
+    # SQLite keeps storing UUIDs as 36-character text.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table in TABLES:
+        op.alter_column(
+            table,
+            "uuid",
+            type_=postgresql.UUID(as_uuid=True),
+            existing_nullable=False,
+            postgresql_using="uuid::uuid",
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table in TABLES:
+        op.alter_column(
+            table,
+            "uuid",
+            type_=sa.Unicode(36),
+            existing_nullable=False,
+            postgresql_using="uuid::text",
+        )
@@ -5,10 +5,10 @@ Revises: 722ff4e4fcc7
 Create Date: 2022-09-29 09:16:32.797138
 
 """
+import sqlalchemy as sa
 from alembic import op
-from sqlalchemy.orm.session import Session
 
-from tiled.authn_database.orm import Role
+from tiled.authn_database.orm import JSONList
 
 # revision identifiers, used by Alembic.
 revision = "56809bcbfcb0"
@@ -17,6 +17,14 @@ branch_labels = None
 depends_on = None
 
 
+# Describe the table as it was at this revision, rather than importing the
+# ORM model, whose scopes column type has changed in a later revision.
+roles = sa.table(
+    "roles",
+    sa.column("name", sa.Unicode(255)),
+    sa.column("scopes", JSONList(511)),
+)
+
 ROLES = ["admin", "user"]
 NEW_SCOPES = ["create"]
 
@@ -26,13 +34,10 @@ def upgrade():
     Add new scopes to Roles.
     """
     connection = op.get_bind()
-    with Session(bind=connection) as db:
-        for role_name in ROLES:
-            role = db.query(Role).filter(Role.name == role_name).first()
-            scopes = role.scopes.copy()
-            scopes.extend(NEW_SCOPES)
-            role.scopes = scopes
-            db.commit()
+    for role_name in ROLES:
+        scopes = _get_scopes(connection, role_name)
+        scopes.extend(NEW_SCOPES)
+        _set_scopes(connection, role_name, scopes)
 
 
 def downgrade():
@@ -40,12 +45,21 @@ def downgrade():
     Remove new scopes from Roles, if present.
     """
     connection = op.get_bind()
-    with Session(bind=connection) as db:
-        for role_name in ROLES:
-            role = db.query(Role).filter(Role.name == role_name).first()
-            scopes = role.scopes.copy()
-            for scope in NEW_SCOPES:
-                if scope in scopes:
-                    scopes.remove(scope)
-            role.scopes = scopes
-            db.commit()
+    for role_name in ROLES:
+        scopes = _get_scopes(connection, role_name)
+        for scope in NEW_SCOPES:
+            if scope in scopes:
+                scopes.remove(scope)
+        _set_scopes(connection, role_name, scopes)
+
+
+def _get_scopes(connection, role_name):
+    return connection.execute(
+        sa.select(roles.c.scopes).where(roles.c.name == role_name)
+    ).scalar_one()
+
+
+def _set_scopes(connection, role_name, scopes):
+    connection.execute(
+        roles.update().where(roles.c.name == role_name).values(scopes=scopes)
+    )
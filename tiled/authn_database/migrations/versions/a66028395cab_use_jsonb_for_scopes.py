@@ -0,0 +1,48 @@
+"""Use JSONB for scopes on PostgreSQL.
+
+Revision ID: a66028395cab
+Revises: c7bd2573716d
+Create Date: 2023-08-14 10:21:36.519204
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+
+from tiled.authn_database.orm import APIKey, Role
+
+# revision identifiers, used by Alembic.
+revision = "a66028395cab"
+down_revision = "c7bd2573716d"
+branch_labels = None
+depends_on = None
+
+TABLES = [Role.__tablename__, APIKey.__tablename__]
+
+
+def upgrade():
+    # SQLite stores JSON as text, which is what the scopes columns already
+    # hold, so only PostgreSQL needs its columns converted.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table in TABLES:
+        op.alter_column(
+            table,
+            "scopes",
+            type_=JSONB(),
+            existing_nullable=False,
+            postgresql_using="scopes::jsonb",
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table in TABLES:
+        op.alter_column(
+            table,
+            "scopes",
+            type_=sa.Unicode(511),
+            existing_nullable=False,
+            postgresql_using="scopes::text",
+        )
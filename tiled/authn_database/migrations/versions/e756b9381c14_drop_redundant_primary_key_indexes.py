@@ -0,0 +1,32 @@
+"""Drop indexes that duplicate primary keys.
+
+Revision ID: e756b9381c14
+Revises: 0b033e7fbe30
+Create Date: 2023-08-17 11:40:27.305182
+
+"""
+from alembic import op
+
+from tiled.authn_database.orm import APIKey, Session
+
+# revision identifiers, used by Alembic.
+revision = "e756b9381c14"
+down_revision = "0b033e7fbe30"
+branch_labels = None
+depends_on = None
+
+# (index name, table name, column name)
+INDEXES = [
+    ("ix_api_keys_hashed_secret", APIKey.__tablename__, "hashed_secret"),
+    ("ix_sessions_id", Session.__tablename__, "id"),
+]
+
+
+def upgrade():
+    for index_name, table_name, _ in INDEXES:
+        op.drop_index(index_name, table_name=table_name)
+
+
+def downgrade():
+    for index_name, table_name, column_name in INDEXES:
+        op.create_index(index_name, table_name, [column_name])
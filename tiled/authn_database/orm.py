@@ -1,3 +1,4 @@
+import functools
 import json
 import uuid as uuid_module
 
@@ -12,7 +13,9 @@ from sqlalchemy import (
     LargeBinary,
     Table,
     Unicode,
+    inspect,
 )
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -25,6 +28,15 @@ from .base import Base
 JSONVariant = JSON().with_variant(JSONB(), "postgresql")
 
 
+@functools.lru_cache(maxsize=None)
+def _column_keys(cls):
+    """Names of the columns of an authentication table, e.g. Principal.uuid.
+
+    This leaves out relationships such as Principal.roles and APIKey.principal.
+    """
+    return tuple(prop.key for prop in inspect(cls).column_attrs)
+
+
 class JSONList(TypeDecorator):
     """Represents an immutable structure as a JSON-encoded list.
 
@@ -54,10 +66,10 @@ class JSONList(TypeDecorator):
 class UUID(TypeDecorator):
     """Represents a UUID in a dialect-agnostic way
 
-    Postgres has built-in support but SQLite does not, so we
-    just use a 36-character Unicode column.
+    Postgres has built-in support, which stores 16 bytes, so we use it there.
+    SQLite does not, so we just use a 36-character Unicode column.
 
-    We could use 16-byte LargeBinary, which would be more compact
+    On SQLite, we could use 16-byte LargeBinary, which would be more compact
     but we decided it was worth the cost to make the content easily
     inspectable by external database management and development tools.
     """
@@ -65,15 +77,23 @@ class UUID(TypeDecorator):
     impl = Unicode(36)
     cache_ok = True
 
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=True))
+        return dialect.type_descriptor(self.impl)
+
     def process_bind_param(self, value, dialect):
         if value is not None:
             if not isinstance(value, uuid_module.UUID):
                 raise ValueError(f"Expected uuid.UUID, got {type(value)}")
-            return str(value)
+            if dialect.name != "postgresql":
+                return str(value)
+        return value
 
     def process_result_value(self, value, dialect):
-        if value is not None:
+        if (value is not None) and (dialect.name != "postgresql"):
             return uuid_module.UUID(hex=value)
+        return value
 
 
 class Timestamped:
@@ -92,12 +112,17 @@ class Timestamped:
     )  # null until first update
 
     def __repr__(self):
+        # Show only the columns that are already loaded, read from __dict__ so
+        # that no lazy load is triggered, as one would fail outside of an
+        # async session. Skip relationships: a Principal's api_keys and
+        # sessions each point back to the Principal.
+        state = self.__dict__
         return (
             f"{type(self).__name__}("
             + ", ".join(
-                f"{key}={value!r}"
-                for key, value in self.__dict__.items()
-                if not key.startswith("_")
+                f"{key}={state[key]!r}"
+                for key in _column_keys(type(self))
+                if key in state
             )
             + ")"
         )
@@ -156,7 +181,7 @@ class Role(Timestamped, Base):
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     name = Column(Unicode(255), index=True, unique=True, nullable=False)
     description = Column(Unicode(1023), nullable=True)
-    scopes = Column(JSONList(511), nullable=False)
+    scopes = Column(JSONVariant, nullable=False)
     principals = relationship(
         "Principal", secondary=principal_role_association_table, back_populates="roles"
     )
@@ -169,16 +194,16 @@ class APIKey(Timestamped, Base):
     # The key holder can use this to identity the key.
     # We do not store the full secret, only its sha256-hashed value.
     # A primary key on (first_eight, hashed_secret) enables
-    # fast lookups.
+    # fast lookups, so hashed_secret needs no separate index.
+    # The index on first_eight serves revocation, which looks
+    # keys up by first_eight alone.
     first_eight = Column(Unicode(8), primary_key=True, index=True, nullable=False)
-    hashed_secret = Column(
-        LargeBinary(32), primary_key=True, index=True, nullable=False
-    )
+    hashed_secret = Column(LargeBinary(32), primary_key=True, nullable=False)
     expiration_time = Column(DateTime(timezone=False), nullable=True)
     latest_activity = Column(DateTime(timezone=False), nullable=True)
     note = Column(Unicode(1023), nullable=True)
     principal_id = Column(Integer, ForeignKey("principals.id"), nullable=False)
-    scopes = Column(JSONList(511), nullable=False)
+    scopes = Column(JSONVariant, nullable=False)
     # In the future we could make it possible to disable API keys
     # without deleting them from the database, for forensics and
     # record-keeping.
@@ -198,7 +223,7 @@ class Session(Timestamped, Base):
     __tablename__ = "sessions"
 
     # This id is internal, never exposed to the client.
-    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    id = Column(Integer, primary_key=True, autoincrement=True)
     # This uuid is exposed to the client.
     uuid = Column(UUID, index=True, nullable=False, default=uuid_module.uuid4)
     time_last_refreshed = Column(DateTime(timezone=False), nullable=True)
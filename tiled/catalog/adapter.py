@@ -12,10 +12,9 @@ from urllib.parse import quote_plus
 
 import httpx
 from fastapi import HTTPException
-from sqlalchemy import event, func, text, type_coerce
+from sqlalchemy import event, func, select, text, type_coerce
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import create_async_engine
-from sqlalchemy.future import select
 
 from tiled.queries import (
     Comparison,
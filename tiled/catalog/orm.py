@@ -1,3 +1,5 @@
+import functools
+
 from sqlalchemy import (
     JSON,
     Boolean,
@@ -9,6 +11,7 @@ from sqlalchemy import (
     Integer,
     Table,
     Unicode,
+    inspect,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
@@ -23,6 +26,16 @@ from .base import Base
 JSONVariant = JSON().with_variant(JSONB(), "postgresql")
 
 
+@functools.lru_cache(maxsize=None)
+def _column_keys(cls):
+    """Names of the columns of a catalog table, e.g. Node.key.
+
+    This leaves out relationships such as Node.data_sources and
+    DataSource.assets.
+    """
+    return tuple(prop.key for prop in inspect(cls).column_attrs)
+
+
 class Timestamped:
     """
     Mixin for providing timestamps of creation and update time.
@@ -37,12 +50,16 @@ class Timestamped:
     )
 
     def __repr__(self):
+        # Show only the columns that are already loaded, read from __dict__ so
+        # that no lazy load is triggered. Skip relationships, so that printing
+        # a Node does not print all of its data sources and their assets.
+        state = self.__dict__
         return (
             f"{type(self).__name__}("
             + ", ".join(
-                f"{key}={value!r}"
-                for key, value in self.__dict__.items()
-                if not key.startswith("_")
+                f"{key}={state[key]!r}"
+                for key in _column_keys(type(self))
+                if key in state
             )
             + ")"
         )
@@ -1,11 +1,20 @@
+import builtins
 import itertools
+import math
+import operator
 
 import dask
 import dask.array
 import numpy
 
 from .base import BaseStructureClient
-from .utils import export_util, handle_error, params_from_slice
+from .utils import ClientError, export_util, handle_error, params_from_slice
+
+# When a whole array is read, adjacent blocks are downloaded together in
+# batches, bounded by these limits.
+BLOCKS_BATCH_BYTESIZE_LIMIT = 4_000_000  # 4 MB
+URL_CHARACTER_LIMIT = 2000  # number of characters
+_EXTRA_CHARS_PER_BLOCK = len("&block=")
 
 
 class _DaskArrayClient(BaseStructureClient):
@@ -62,7 +71,7 @@ class _DaskArrayClient(BaseStructureClient):
         )
 
     def __array__(self, *args, **kwargs):
-        return self.read().__array__(*args, **kwargs)
+        return self._read_all().__array__(*args, **kwargs)
 
     def _get_block(self, block, dtype, shape, slice=None):
         """
@@ -102,6 +111,85 @@ class _DaskArrayClient(BaseStructureClient):
         ).read()
         return numpy.frombuffer(content, dtype=dtype).reshape(shape)
 
+    def _get_blocks(self, blocks, dtype, shapes):
+        """
+        Fetch the actual data for several blocks in a chunked (dask) array.
+
+        The blocks are downloaded in one request. See read_blocks() for a
+        public version of this.
+        """
+        if "blocks" not in self.item["links"]:
+            # This server predates the /array/blocks route.
+            return self._get_each_block(blocks, dtype, shapes)
+        media_type = "application/octet-stream"
+        try:
+            content = handle_error(
+                self.context.http_client.get(
+                    self.item["links"]["blocks"],
+                    headers={"Accept": media_type},
+                    params={"block": [",".join(map(str, block)) for block in blocks]},
+                )
+            ).read()
+        except ClientError as err:
+            if err.response.status_code != 400:
+                raise
+            # The server rejected the batch, e.g. because it is larger than
+            # the server's response_bytesize_limit. Request the blocks one
+            # at a time instead.
+            return self._get_each_block(blocks, dtype, shapes)
+        # The server sends the blocks flattened and concatenated, in the order
+        # that we requested them.
+        arrays = []
+        offset = 0
+        for shape in shapes:
+            count = math.prod(shape)
+            arrays.append(
+                numpy.frombuffer(
+                    content, dtype=dtype, count=count, offset=offset
+                ).reshape(shape)
+            )
+            offset += count * dtype.itemsize
+        return arrays
+
+    def _get_each_block(self, blocks, dtype, shapes):
+        "Fetch several blocks, one request per block."
+        return [
+            self._get_block(block, dtype, shape) for block, shape in zip(blocks, shapes)
+        ]
+
+    def _batch_blocks(self, blocks, shapes, dtype):
+        """
+        Group blocks (in order) into batches that can be fetched in one request.
+
+        Returns a list of (blocks, shapes) pairs, one per batch.
+        """
+        link = self.item["links"]["blocks"]
+        batches = []
+        batch = []
+        batch_shapes = []
+        bytesize = 0
+        budget = URL_CHARACTER_LIMIT - len(link)
+        for block, shape in zip(blocks, shapes):
+            block_bytesize = math.prod(shape) * dtype.itemsize
+            block_chars = _EXTRA_CHARS_PER_BLOCK + len(",".join(map(str, block)))
+            if batch and (
+                (bytesize + block_bytesize > BLOCKS_BATCH_BYTESIZE_LIMIT)
+                or (block_chars > budget)
+            ):
+                # Close this batch and start the next one with `block`.
+                batches.append((batch, batch_shapes))
+                batch = []
+                batch_shapes = []
+                bytesize = 0
+                budget = URL_CHARACTER_LIMIT - len(link)
+            batch.append(block)
+            batch_shapes.append(shape)
+            bytesize += block_bytesize
+            budget -= block_chars
+        if batch:
+            batches.append((batch, batch_shapes))
+        return batches
+
     def read_block(self, block, slice=None):
         """
         Access the data for one block of this chunked (dask) array.
@@ -125,12 +213,45 @@ class _DaskArrayClient(BaseStructureClient):
             dask_array = dask_array[slice]
         return dask_array
 
+    def read_blocks(self, blocks):
+        """
+        Access the data for several blocks of this chunked (dask) array.
+
+        The blocks are downloaded together, in one request.
+        """
+        structure = self.structure()
+        chunks = structure.macro.chunks
+        dtype = structure.micro.to_numpy_dtype()
+        blocks = [tuple(block) for block in blocks]
+        shapes = []
+        for block in blocks:
+            try:
+                shapes.append(tuple(chunks[dim][i] for dim, i in enumerate(block)))
+            except IndexError:
+                raise IndexError(f"Block index {block} out of range")
+        batch = dask.delayed(self._get_blocks, nout=len(blocks))(blocks, dtype, shapes)
+        return [
+            dask.array.from_delayed(array, dtype=dtype, shape=shape)
+            for array, shape in zip(batch, shapes)
+        ]
+
     def read(self, slice=None):
         """
         Acess the entire array or a slice.
 
         The array will be internally chunked with dask.
         """
+        return self._read(slice)
+
+    def _read(self, slice=None, *, batch_blocks=False):
+        """
+        Build a dask array for the entire array or a slice.
+
+        With batch_blocks=True, adjacent blocks are downloaded together. Use
+        this only when the whole array is about to be computed: if the caller
+        goes on to index into the dask array, each block it touches will pull
+        in its entire batch.
+        """
         structure = self.structure()
         shape = structure.macro.shape
         dtype = structure.micro.to_numpy_dtype()
@@ -140,19 +261,44 @@ class _DaskArrayClient(BaseStructureClient):
         chunks = structure.macro.chunks
         # Count the number of blocks along each axis.
         num_blocks = (range(len(n)) for n in chunks)
-        # Loop over each block index --- e.g. (0, 0), (0, 1), (0, 2) .... ---
-        # and build a dask task encoding the method for fetching its data from
-        # the server.
-        dask_tasks = {
-            (name,)
-            + block: (
-                self._get_block,
-                block,
-                dtype,
-                tuple(chunks[dim][i] for dim, i in enumerate(block)),
-            )
-            for block in itertools.product(*num_blocks)
-        }
+        # Enumerate each block index --- e.g. (0, 0), (0, 1), (0, 2) .... ---
+        # and, in the same order, the shape of each block.
+        blocks = list(itertools.product(*num_blocks))
+        shapes = list(itertools.product(*chunks))
+        if (
+            batch_blocks
+            and (slice is None)
+            and (len(blocks) > 1)
+            and ("blocks" in self.item["links"])
+        ):
+            # Optimization: When reading the whole array, download adjacent
+            # blocks in batches. Each batch is one dask task, and each block
+            # is a task that picks its data out of its batch.
+            name = "remote-dask-array-batched-" f"{self.uri}"
+            dask_tasks = {}
+            batch_name = "remote-dask-array-batch-" f"{self.uri}"
+            for batch_index, (batch, batch_shapes) in enumerate(
+                self._batch_blocks(blocks, shapes, dtype)
+            ):
+                dask_tasks[(batch_name, batch_index)] = (
+                    self._get_blocks,
+                    batch,
+                    dtype,
+                    batch_shapes,
+                )
+                for i, block in enumerate(batch):
+                    dask_tasks[(name,) + block] = (
+                        operator.getitem,
+                        (batch_name, batch_index),
+                        i,
+                    )
+        else:
+            # Build a dask task for each block encoding the method for
+            # fetching its data from the server.
+            dask_tasks = {
+                (name,) + block: (self._get_block, block, dtype, block_shape)
+                for block, block_shape in zip(blocks, shapes)
+            }
         dask_array = dask.array.Array(
             dask=dask_tasks, name=name, chunks=chunks, dtype=dtype, shape=shape
         )
@@ -160,6 +306,45 @@ class _DaskArrayClient(BaseStructureClient):
             dask_array = dask_array[slice]
         return dask_array
 
+    def _read_all(self):
+        """
+        Download the entire array into memory.
+
+        Adjacent blocks are downloaded together in batches, concurrently, and
+        each batch is copied directly into its place in one preallocated
+        array, rather than being stitched together by dask.
+        """
+        structure = self.structure()
+        shape = structure.macro.shape
+        dtype = structure.micro.to_numpy_dtype()
+        chunks = structure.macro.chunks
+        blocks = list(itertools.product(*(range(len(n)) for n in chunks)))
+        if (len(blocks) < 2) or ("blocks" not in self.item["links"]):
+            return self._read(batch_blocks=True).compute()
+        shapes = list(itertools.product(*chunks))
+        # The index where each block starts, along each axis
+        starts = [list(itertools.accumulate(n, initial=0)) for n in chunks]
+        batches = self._batch_blocks(blocks, shapes, dtype)
+        # The tasks return the downloaded blocks, and they are copied into
+        # place here, because the tasks may run in other processes (e.g. with
+        # dask's distributed scheduler), which cannot write into this array.
+        results = dask.compute(
+            *(
+                dask.delayed(self._get_blocks)(batch, dtype, batch_shapes)
+                for batch, batch_shapes in batches
+            )
+        )
+        out = numpy.empty(shape, dtype=dtype)
+        for (batch, batch_shapes), arrays in zip(batches, results):
+            for block, block_shape, array in zip(batch, batch_shapes, arrays):
+                out[
+                    tuple(
+                        builtins.slice(starts[dim][i], starts[dim][i] + length)
+                        for dim, (i, length) in enumerate(zip(block, block_shape))
+                    )
+                ] = array
+        return out
+
     def write(self, array):
         handle_error(
             self.context.http_client.put(
@@ -245,7 +430,7 @@ class DaskArrayClient(_DaskArrayClient):
 
     def compute(self):
         "Alias to client.read().compute()"
-        return self.read().compute()
+        return self._read_all()
 
 
 class ArrayClient(DaskArrayClient):
@@ -255,7 +440,9 @@ class ArrayClient(DaskArrayClient):
         """
         Acess the entire array or a slice.
         """
-        return super().read(slice).compute()
+        if slice is None:
+            return self._read_all()
+        return super()._read(slice).compute()
 
     def read_block(self, block, slice=None):
         """
@@ -264,3 +451,11 @@ class ArrayClient(DaskArrayClient):
         Optionally, access only a slice *within* this block.
         """
         return super().read_block(block, slice).compute()
+
+    def read_blocks(self, blocks):
+        """
+        Access the data for several blocks of this chunked array.
+
+        The blocks are downloaded together, in one request.
+        """
+        return list(dask.compute(*super().read_blocks(blocks)))
@@ -206,7 +206,9 @@ class BaseClient:
 
         content = handle_error(
             self.context.http_client.put(
-                self.item["links"]["self"], content=safe_json_dump(data)
+                self.item["links"]["self"],
+                content=safe_json_dump(data),
+                headers={"Accept": MSGPACK_MIME_TYPE},
             )
         ).json()
 
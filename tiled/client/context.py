@@ -12,11 +12,16 @@ import appdirs
 import httpx
 
 from .._version import __version__ as tiled_version
-from ..utils import UNSET, DictView
+from ..utils import UNSET, DictView, modules_available
 from .auth import CannotRefreshAuthentication, TiledAuth, build_refresh_request
 from .decoders import SUPPORTED_DECODERS
 from .transport import Transport
-from .utils import DEFAULT_TIMEOUT_PARAMS, MSGPACK_MIME_TYPE, handle_error
+from .utils import (
+    DEFAULT_LIMITS_PARAMS,
+    DEFAULT_TIMEOUT_PARAMS,
+    MSGPACK_MIME_TYPE,
+    handle_error,
+)
 
 USER_AGENT = f"python-tiled/{tiled_version}"
 API_KEY_AUTH_HEADER_PATTERN = re.compile(r"^Apikey (\w+)$")
@@ -94,8 +99,18 @@ class Context:
         if cache is UNSET:
             cache = None
         if app is None:
+            # When given a custom transport, httpx.Client ignores its own
+            # verify and limits arguments, so set them on the HTTPTransport
+            # that our caching Transport wraps. HTTP/2, which multiplexes
+            # concurrent requests over one connection, is used if the
+            # optional h2 package is installed.
+            transport = httpx.HTTPTransport(
+                verify=verify,
+                http2=modules_available("h2"),
+                limits=httpx.Limits(**DEFAULT_LIMITS_PARAMS),
+            )
             client = httpx.Client(
-                transport=Transport(cache=cache),
+                transport=Transport(transport=transport, cache=cache),
                 verify=verify,
                 timeout=timeout,
                 follow_redirects=True,
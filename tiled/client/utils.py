@@ -141,14 +141,21 @@ DEFAULT_TIMEOUT_PARAMS = {
     "write": 30.0,
     "pool": 5.0,
 }
+# Keep enough connections alive between requests to serve the concurrent
+# block and batch downloads without setting up (TCP, TLS) a new one each time.
+DEFAULT_LIMITS_PARAMS = {
+    "max_connections": 100,
+    "max_keepalive_connections": 32,
+}
 
 
 def params_from_slice(slice):
     "Generate URL query param ?slice=... from Python slice object."
     params = {}
     if slice is not None:
-        if isinstance(slice, (int, builtins.slice)):
-            slice = [slice]
+        if not isinstance(slice, (tuple, list)):
+            # A single dimension: an int (including numpy integers) or a slice.
+            slice = (slice,)
         slices = []
         for dim in slice:
             if isinstance(dim, builtins.slice):
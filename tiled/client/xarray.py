@@ -1,4 +1,6 @@
+import concurrent.futures
 import threading
+import time
 
 import dask
 import dask.array
@@ -8,13 +10,21 @@ import xarray
 from ..serialization.dataframe import deserialize_arrow
 from ..structures.core import Spec
 from ..utils import APACHE_ARROW_FILE_MIME_TYPE
-from .container import Container
+from .array import DaskArrayClient
+from .container import LENGTH_CACHE_TTL, Container
 from .utils import handle_error
 
 LENGTH_LIMIT_FOR_WIDE_TABLE_OPTIMIZATION = 1_000_000
 
 
 class DaskDatasetClient(Container):
+    # Whether read() loads the data into memory, as opposed to returning
+    # a dataset backed by lazy dask arrays.
+    _load_on_read = False
+    # The (key, client) pairs of the variables and the deadline after which
+    # they must be listed again, as in Container._cached_len
+    _cached_variables = None
+
     def _repr_pretty_(self, p, cycle):
         """
         Provide "pretty" display in IPython/Jupyter.
@@ -31,37 +41,48 @@ class DaskDatasetClient(Container):
         """
         return list(self)
 
+    def _variables(self):
+        # List the variables at most once per LENGTH_CACHE_TTL, rather than on
+        # every read. A large dataset does not have its contents inlined, so
+        # listing it takes requests.
+        now = time.monotonic()
+        if self._cached_variables is not None:
+            variables, deadline = self._cached_variables
+            if now < deadline:
+                return variables
+        variables = list(self.items())
+        self._cached_variables = (variables, now + LENGTH_CACHE_TTL)
+        return variables
+
+    def new(self, *args, **kwargs):
+        self._cached_variables = None
+        return super().new(*args, **kwargs)
+
+    def delete(self, key):
+        self._cached_variables = None
+        return super().delete(key)
+
     def _build_arrays(self, variables, optimize_wide_table):
         data_vars = {}
         coords = {}
         # Optimization: Download scalar columns in batch as DataFrame.
-        # on first access.
-        coords_fetcher = _WideTableFetcher(
-            self.context.http_client.get, self.item["links"]["full"]
-        )
-        data_vars_fetcher = _WideTableFetcher(
-            self.context.http_client.get, self.item["links"]["full"]
-        )
-        array_clients = {}
-        array_structures = {}
-        first_dims = []
-        for name, array_client in self.items():
+        # on first access. Variables are grouped by dimension, so that coords
+        # are downloaded in the same request as the data_vars they index.
+        # All the variables along one dimension have the same length, so this
+        # works for ragged datasets too.
+        fetchers = {}
+        for name, array_client in self._variables():
             if (variables is not None) and (name not in variables):
                 continue
-            array_clients[name] = array_client
+            # Look up the structure and specs once per variable, rather than
+            # going through the array_client properties (dims, specs), which
+            # re-derive them on every access.
             array_structure = array_client.structure()
-            array_structures[name] = array_structure
-            if array_structure.macro.shape:
-                first_dims.append(array_structure.macro.shape[0])
-            else:
-                first_dims.append(None)
-        if len(set(first_dims)) > 1:
-            # ragged, not tabular
-            optimize_wide_table = False
-        for name, array_client in array_clients.items():
-            array_structure = array_structures[name]
             shape = array_structure.macro.shape
-            spec_names = set(spec.name for spec in array_client.specs)
+            dims = array_structure.macro.dims
+            spec_names = set(
+                spec["name"] for spec in array_client.item["attributes"]["specs"]
+            )
             if optimize_wide_table and (
                 (not shape)  # empty
                 or (
@@ -69,15 +90,20 @@ class DaskDatasetClient(Container):
                     and (len(shape) < 2)
                 )
             ):
+                if dims not in fetchers:
+                    fetchers[dims] = _WideTableFetcher(
+                        self.context.http_client.get, self.item["links"]["full"]
+                    )
+                fetcher = fetchers[dims]
                 if "xarray_coord" in spec_names:
                     coords[name] = (
-                        array_client.dims,
-                        coords_fetcher.register(name, array_client, array_structure),
+                        dims,
+                        fetcher.register(name, array_client, array_structure),
                     )
                 elif "xarray_data_var" in spec_names:
                     data_vars[name] = (
-                        array_client.dims,
-                        data_vars_fetcher.register(name, array_client, array_structure),
+                        dims,
+                        fetcher.register(name, array_client, array_structure),
                     )
                 else:
                     raise ValueError(
@@ -85,10 +111,20 @@ class DaskDatasetClient(Container):
                         "'xarray_coord' or 'xarray_data_var'."
                     )
             else:
+                if isinstance(array_client, DaskArrayClient):
+                    # Use the dask-backed read even from the in-memory
+                    # DatasetClient so that each variable is not downloaded
+                    # here, one at a time. Instead, read().load() fetches
+                    # all of them concurrently. Batch the blocks only if the
+                    # dataset will be loaded; a lazy dataset should download
+                    # only the blocks that are actually used.
+                    array = array_client._read(batch_blocks=self._load_on_read)
+                else:
+                    array = array_client.read()
                 if "xarray_coord" in spec_names:
-                    coords[name] = (array_client.dims, array_client.read())
+                    coords[name] = (dims, array)
                 elif "xarray_data_var" in spec_names:
-                    data_vars[name] = (array_client.dims, array_client.read())
+                    data_vars[name] = (dims, array)
                 else:
                     raise ValueError(
                         "Child nodes of xarray_dataset should include spec "
@@ -104,6 +140,8 @@ class DaskDatasetClient(Container):
 
 
 class DatasetClient(DaskDatasetClient):
+    _load_on_read = True
+
     def read(self, variables=None, *, optimize_wide_table=True):
         return (
             super()
@@ -114,6 +152,9 @@ class DatasetClient(DaskDatasetClient):
 
 URL_CHARACTER_LIMIT = 2000  # number of characters
 _EXTRA_CHARS_PER_ITEM = len("&field=")
+# When the variables must be split across several requests, run this many
+# requests at a time.
+MAX_CONCURRENT_REQUESTS = 8
 
 
 class _WideTableFetcher:
@@ -126,6 +167,10 @@ class _WideTableFetcher:
         # do not prompts us to re-request the same data. Only the first worker
         # to ask for the data should trigger a request.
         self._lock = threading.Lock()
+        # Build the task that fetches the dataframe once, and derive each
+        # variable from it, so that all the variables share a single task
+        # rather than each carrying its own copy into the dask graph.
+        self._delayed_dataframe = dask.delayed(self.dataframe)()
 
     def register(self, name, array_client, array_structure):
         if self._dataframe is not None:
@@ -133,7 +178,7 @@ class _WideTableFetcher:
         self.variables.append(name)
         # TODO Can we avoid .values here?
         return dask.array.from_delayed(
-            dask.delayed(self.dataframe)()[name].values,
+            self._delayed_dataframe[name].values,
             shape=array_structure.macro.shape,
             dtype=array_structure.micro.to_numpy_dtype(),
         )
@@ -141,33 +186,43 @@ class _WideTableFetcher:
     def dataframe(self):
         with self._lock:
             if self._dataframe is None:
-                # If self.variables contains many and/or lengthy names,
-                # we can bump into the URI size limit commonly imposed by
-                # HTTP stacks (e.g. nginx). The HTTP spec does not define a limit,
-                # but a common setting is 4K or 8K (for all the headers together).
-                # As another reference point, Internet Explorer imposes a
-                # 2048-character limit on URLs.
-                variables = []
-                dataframes = []
-                budget = URL_CHARACTER_LIMIT
-                budget -= len(self.link)
-                # Fetch the variables in batches.
-                for variable in self.variables:
-                    budget -= _EXTRA_CHARS_PER_ITEM + len(variable)
-                    if budget < 0:
-                        # Fetch a batch and then add `variable` to the next batch.
-                        dataframes.append(self._fetch_variables(variables))
-                        variables.clear()
-                        budget = URL_CHARACTER_LIMIT - (
-                            _EXTRA_CHARS_PER_ITEM + len(variable)
-                        )
-                    variables.append(variable)
-                if variables:
-                    # Fetch the final batch.
-                    dataframes.append(self._fetch_variables(variables))
+                batches = self._plan_batches()
+                if len(batches) == 1:
+                    dataframes = [self._fetch_variables(batches[0])]
+                else:
+                    # Fetch the batches concurrently.
+                    with concurrent.futures.ThreadPoolExecutor(
+                        max_workers=min(len(batches), MAX_CONCURRENT_REQUESTS)
+                    ) as executor:
+                        dataframes = list(executor.map(self._fetch_variables, batches))
                 self._dataframe = pandas.concat(dataframes, axis=1).reset_index()
         return self._dataframe
 
+    def _plan_batches(self):
+        # If self.variables contains many and/or lengthy names,
+        # we can bump into the URI size limit commonly imposed by
+        # HTTP stacks (e.g. nginx). The HTTP spec does not define a limit,
+        # but a common setting is 4K or 8K (for all the headers together).
+        # As another reference point, Internet Explorer imposes a
+        # 2048-character limit on URLs.
+        batches = []
+        variables = []
+        budget = URL_CHARACTER_LIMIT
+        budget -= len(self.link)
+        # Split the variables into batches.
+        for variable in self.variables:
+            budget -= _EXTRA_CHARS_PER_ITEM + len(variable)
+            if budget < 0:
+                # Close this batch and then add `variable` to the next batch.
+                batches.append(variables)
+                variables = []
+                budget = URL_CHARACTER_LIMIT - (_EXTRA_CHARS_PER_ITEM + len(variable))
+            variables.append(variable)
+        if variables:
+            # Close the final batch.
+            batches.append(variables)
+        return batches
+
     def _fetch_variables(self, variables):
         content = handle_error(
             self.get(
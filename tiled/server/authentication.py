@@ -27,8 +27,8 @@ from fastapi.security import (
 from fastapi.security.api_key import APIKeyBase, APIKeyCookie, APIKeyQuery
 from fastapi.security.utils import get_authorization_scheme_param
 from fastapi.templating import Jinja2Templates
-from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload, selectinload
 from sqlalchemy.sql import func
 
 # To hide third-party warning
@@ -441,7 +441,7 @@ async def create_session(
         await db.execute(
             select(orm.Session)
             .options(
-                selectinload(orm.Session.principal).selectinload(
+                joinedload(orm.Session.principal).selectinload(
                     orm.Principal.identities
                 ),
             )
@@ -571,6 +571,7 @@ async def construct_resource(
                     links[
                         "block"
                     ] = f"{base_url}/array/block/{path_str}?block={block_template}"
+                    links["blocks"] = f"{base_url}/array/blocks/{path_str}"
                 elif entry.structure_family == StructureFamily.dataframe:
                     links[
                         "partition"
@@ -647,12 +648,26 @@ def _fallback_msgpack_encoder(obj):
     return obj
 
 
+# Types that make up most of a response and cannot hold a datetime
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
 def _patch_naive_datetimes(obj):
     """
     If a naive datetime is found, attach local time.
 
     Msgpack can only serialize datetimes with tzinfo.
     """
+    # This runs only when msgpack has refused a naive datetime, and then it
+    # walks the whole response. Check the exact type of the common built-ins
+    # first, to avoid the hasattr lookup and the (slow) ABC check below.
+    obj_type = type(obj)
+    if obj_type in _SCALAR_TYPES:
+        return obj
+    if obj_type is dict:
+        return {k: _patch_naive_datetimes(v) for k, v in obj.items()}
+    if obj_type in (list, tuple):
+        return [_patch_naive_datetimes(item) for item in obj]
     if hasattr(obj, "items"):
         patched_obj = {}
         for k, v in obj.items():
@@ -1,6 +1,7 @@
+import re
 from enum import Enum
 from functools import lru_cache
-from typing import Optional
+from typing import List, Optional
 
 import pydantic
 from fastapi import Depends, HTTPException, Query, Request, Security
@@ -143,6 +144,24 @@ def block(
     return tuple(map(int, block.split(",")))
 
 
+_BLOCK_PATTERN = re.compile("^[0-9]+(,[0-9]+)*$|^$")
+
+
+def blocks(
+    # Ellipsis as the "default" tells FastAPI to make this parameter required.
+    block: List[str] = Query(...),
+):
+    "Specify and parse a list of block index parameters, as in ?block=0,0&block=0,1"
+    parsed = []
+    for item in block:
+        if not _BLOCK_PATTERN.match(item):
+            raise HTTPException(
+                status_code=400, detail=f"Could not parse block index {item!r}"
+            )
+        parsed.append(tuple(map(int, item.split(","))) if item else ())
+    return parsed
+
+
 def expected_shape(
     expected_shape: Optional[str] = Query(
         None, min_length=1, pattern="^[0-9]+(,[0-9]+)*$|^scalar$"
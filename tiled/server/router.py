@@ -1,6 +1,8 @@
 import base64
 import dataclasses
 import inspect
+import itertools
+import math
 from datetime import datetime, timedelta
 from functools import partial
 from typing import Any, List, Optional
@@ -33,6 +35,7 @@ from .dependencies import (
     EntryKind,
     SecureEntry,
     block,
+    blocks,
     expected_shape,
     get_deserialization_registry,
     get_query_registry,
@@ -49,6 +52,11 @@ from .utils import (
     record_timing,
 )
 
+# When the blocks requested from /array/blocks lie close together, read the
+# region that spans them all in one read, provided that it is no more than
+# this many bytes larger than the requested blocks themselves.
+BLOCKS_COALESCE_GAP_BYTESIZE_LIMIT = 65_536  # 64 KiB
+
 router = APIRouter()
 
 
@@ -425,6 +433,127 @@ async def array_block(
         raise HTTPException(status_code=406, detail=err.args[0])
 
 
+@router.get(
+    "/array/blocks/{path:path}", response_model=schemas.Response, name="array blocks"
+)
+async def array_blocks(
+    request: Request,
+    entry=SecureEntry(scopes=["read:data"]),
+    blocks=Depends(blocks),
+    format: Optional[str] = None,
+    filename: Optional[str] = None,
+    serialization_registry=Depends(get_serialization_registry),
+    settings: BaseSettings = Depends(get_settings),
+):
+    """
+    Fetch several chunks of array-like data in one response.
+
+    The chunks are flattened and concatenated in the order they were requested.
+    """
+    if entry.structure_family != "array":
+        raise HTTPException(
+            status_code=404,
+            detail=f"Cannot read {entry.structure_family} structure with /array/blocks route.",
+        )
+    # Deferred import because this is not a required dependency of the server
+    # for some use cases.
+    import numpy
+
+    shape = entry.macrostructure().shape
+    # Check that block dimensionality matches array dimensionality.
+    ndim = len(shape)
+    if ndim == 0:
+        raise HTTPException(
+            status_code=400,
+            detail="A scalar has only one block. Use the /array/block route.",
+        )
+    for block_index in blocks:
+        if len(block_index) != ndim:
+            raise HTTPException(
+                status_code=400,
+                detail=(
+                    f"Each block parameter must have {ndim} comma-separated parameters, "
+                    f"corresponding to the dimensions of this {ndim}-dimensional array."
+                ),
+            )
+    # Locate each block within the array.
+    chunks = entry.macrostructure().chunks
+    starts = [
+        list(itertools.accumulate(dim_chunks, initial=0)) for dim_chunks in chunks
+    ]
+    try:
+        block_slices = [
+            tuple(
+                slice(starts[dim][i], starts[dim][i + 1])
+                for dim, i in enumerate(block_index)
+            )
+            for block_index in blocks
+        ]
+    except IndexError:
+        raise HTTPException(status_code=400, detail="Block index out of range")
+    itemsize = entry.microstructure().to_numpy_dtype().itemsize
+    bytesize = itemsize * sum(_slices_size(slices) for slices in block_slices)
+    if bytesize > settings.response_bytesize_limit:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"Response would exceed {settings.response_bytesize_limit}. "
+                "Request fewer blocks at a time."
+            ),
+        )
+    # The region that spans all the requested blocks
+    region = tuple(
+        slice(
+            min(slices[dim].start for slices in block_slices),
+            max(slices[dim].stop for slices in block_slices),
+        )
+        for dim in range(ndim)
+    )
+    with record_timing(request.state.metrics, "read"):
+        if (len(blocks) > 1) and (
+            itemsize * _slices_size(region) - bytesize
+            <= BLOCKS_COALESCE_GAP_BYTESIZE_LIMIT
+        ):
+            # Optimization: The blocks lie close together. Read them all in
+            # one read of the region that spans them, and cut them out of it.
+            region_array = numpy.asarray(await ensure_awaitable(entry.read, region))
+            arrays = [
+                region_array[
+                    tuple(
+                        slice(s.start - r.start, s.stop - r.start)
+                        for s, r in zip(slices, region)
+                    )
+                ]
+                for slices in block_slices
+            ]
+        else:
+            arrays = []
+            for block_index in blocks:
+                array = await ensure_awaitable(entry.read_block, block_index)
+                arrays.append(numpy.asarray(array))
+    # Keep the entry's dtype. By default, numpy.concatenate would convert
+    # non-native byte order (e.g. '>f8') to native, but the client decodes
+    # the response using the dtype given in the structure.
+    array = numpy.concatenate(
+        [array.ravel() for array in arrays], dtype=arrays[0].dtype
+    )
+    try:
+        with record_timing(request.state.metrics, "pack"):
+            return await construct_data_response(
+                entry.structure_family,
+                serialization_registry,
+                array,
+                entry.metadata,
+                request,
+                format,
+                specs=getattr(entry, "specs", []),
+                expires=getattr(entry, "content_stale_at", None),
+                filename=filename,
+            )
+    except UnsupportedMediaTypes as err:
+        raise HTTPException(status_code=406, detail=err.args[0])
+
+
 @router.get(
     "/array/full/{path:path}", response_model=schemas.Response, name="full array"
 )
@@ -692,6 +821,7 @@ async def post_metadata(
             f"{{{index}}}" for index in range(len(node.structure.macro.shape))
         )
         links["block"] = f"{base_url}/array/block/{path_str}?block={block_template}"
+        links["blocks"] = f"{base_url}/array/blocks/{path_str}"
         links["full"] = f"{base_url}/array/full/{path_str}"
     elif body.structure_family == StructureFamily.sparse:
         # Different from array because of structure.macro.shape vs structure.shape
@@ -928,3 +1058,8 @@ async def delete_revision(
 
     await entry.delete_revision(number)
     return json_or_msgpack(request, None)
+
+
+def _slices_size(slices):
+    "Number of elements in the region selected by a tuple of slices"
+    return math.prod(s.stop - s.start for s in slices)
@@ -185,6 +185,7 @@ class ArrayLinks(pydantic.BaseModel):
     self: str
     full: str
     block: str
+    blocks: str
 
 
 class DataFrameLinks(pydantic.BaseModel):